@@ -8,76 +8,325 @@ from a local ``.env`` file. The file must define the following variables::
     SP_API_SECRET
     SP_API_TOKEN
 
-The resulting access token is printed to stdout. The entire JSON response is
-also emitted to stderr for debugging purposes.
+The resulting access token is printed to stdout. When ``SP_API_DEBUG`` is set,
+the entire JSON response is also emitted to stderr for debugging purposes.
+
+Access tokens are cached in ``sp_api_token.json`` under ``$XDG_CACHE_HOME``
+(default ``~/.cache``) until they expire. Refreshes are serialised through an
+``sp_api_token.lock`` file in the same directory.
 """
 from __future__ import annotations
 
+import atexit
+import hashlib
 import json
 import os
 import sys
-from typing import Dict
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Tuple
+from urllib.parse import quote_plus
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no fcntl
+    fcntl = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
 
-import requests
-from dotenv import load_dotenv
+if TYPE_CHECKING:  # pragma: no cover - imported lazily at runtime
+    import requests
 
 TOKEN_ENDPOINT = "https://api.amazon.com/auth/o2/token"
 FORM_CONTENT_TYPE = "application/x-www-form-urlencoded;charset=UTF-8"
+REQUIRED_VARIABLES = ("SP_API_CLIENT_ID", "SP_API_SECRET", "SP_API_TOKEN")
+
+# Shared session so HTTPS connections are pooled and reused. It is created on first use so
+# that runs served from the token cache never import requests.
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+# Seconds before expiry at which a cached token is considered stale.
+TOKEN_EXPIRY_MARGIN = 60
+
+# Access tokens keyed by (client_id, refresh_token), with their monotonic expiry.
+_TOKEN_CACHE: Dict[Tuple[str, str], Tuple[str, float]] = {}
+_TOKEN_LOCK = threading.Lock()
+
+TOKEN_CACHE_FILENAME = "sp_api_token.json"
+
+# The .env file is parsed once per process; resolved values are memoised here.
+_ENV_LOADED = False
+_ENV_VALUES: Dict[str, str] = {}
 
 
 class MissingEnvironmentVariableError(RuntimeError):
     """Raised when a required environment variable cannot be located."""
 
 
+def json_loads(data: bytes) -> Any:
+    """Parse a JSON document, using orjson when it is installed."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialise ``obj`` as indented JSON for printing.
+
+    The stdlib encoder is used even when orjson is installed, because orjson cannot escape
+    non-ASCII characters and console encodings such as cp1252 cannot print them.
+    """
+
+    return json.dumps(obj, indent=2)
+
+
+def get_session() -> requests.Session:
+    """Return the shared HTTP session used for SP-API requests."""
+
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            # Transient throttling and server errors are retried with jittered exponential
+            # backoff, capped at 30 seconds. This also covers pooled keep-alive connections
+            # that the server has dropped. Auth failures (401/403) are not retried.
+            retry_options: Dict[str, Any] = {
+                "total": 3,
+                "backoff_factor": 1.0,
+                "status_forcelist": [429, 500, 502, 503, 504],
+                "allowed_methods": ["GET", "POST"],
+                "respect_retry_after_header": True,
+                "raise_on_status": False,
+            }
+            try:
+                retry = Retry(**retry_options, backoff_jitter=1.0, backoff_max=30)
+            except TypeError:  # pragma: no cover - urllib3 < 2.0 has no jitter or cap options
+                retry = Retry(**retry_options)
+            session = requests.Session()
+            session.mount(
+                "https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+            )
+            atexit.register(session.close)
+            _SESSION = session
+        return _SESSION
+
+
+def load_env() -> None:
+    """Load variables from the local .env file, once per process."""
+
+    global _ENV_LOADED
+    if not _ENV_LOADED:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _ENV_LOADED = True
+
+
 def get_env_value(name: str) -> str:
     """Retrieve a configuration value from the environment."""
 
-    try:
-        return os.environ[name]
-    except KeyError as exc:  # pragma: no cover - defensive branch
-        raise MissingEnvironmentVariableError(
-            f"Required variable '{name}' is not defined in .env or the environment."
-        ) from exc
+    return get_env_values((name,))[name]
 
 
-def build_request_payload(client_id: str, client_secret: str, refresh_token: str) -> Dict[str, str]:
-    """Build the form payload for the token request."""
+def get_env_values(names: Tuple[str, ...]) -> Dict[str, str]:
+    """Retrieve several configuration values from the environment in one pass."""
 
-    return {
-        "client_id": client_id,
-        "client_secret": client_secret,
-        "grant_type": "refresh_token",
-        "refresh_token": refresh_token,
+    environ = os.environ
+    values = {
+        name: _ENV_VALUES[name] if name in _ENV_VALUES else environ.get(name) for name in names
     }
 
+    for name, value in values.items():
+        if value is None:  # pragma: no cover - defensive branch
+            raise MissingEnvironmentVariableError(
+                f"Required variable '{name}' is not defined in .env or the environment."
+            )
+
+    _ENV_VALUES.update(values)
+    return values
+
+
+def build_request_payload(client_id: str, client_secret: str, refresh_token: str) -> bytes:
+    """Build the URL-encoded form payload for the token request."""
+
+    return b"client_id=%s&client_secret=%s&grant_type=refresh_token&refresh_token=%s" % (
+        quote_plus(client_id).encode("ascii"),
+        quote_plus(client_secret).encode("ascii"),
+        quote_plus(refresh_token).encode("ascii"),
+    )
+
 
 def fetch_access_token() -> str:
     """Execute the token request and return the access token string."""
 
     # Load environment variables from .env file
-    load_dotenv()
+    load_env()
+
+    credentials = get_env_values(REQUIRED_VARIABLES)
+    client_id, client_secret, refresh_token = (credentials[name] for name in REQUIRED_VARIABLES)
+
+    cache_key = (client_id, refresh_token)
+
+    # Holding the lock across the request coalesces concurrent callers into one fetch.
+    with _TOKEN_LOCK:
+        cached = _TOKEN_CACHE.get(cache_key)
+        if cached is not None and time.monotonic() < cached[1] - TOKEN_EXPIRY_MARGIN:
+            return cached[0]
+
+        # Likewise, other processes sharing the token file wait here while one refreshes.
+        with _token_file_lock():
+            stored = _read_token_file(cache_key)
+            if stored is not None:
+                access_token, expiry = stored
+                _TOKEN_CACHE[cache_key] = (access_token, time.monotonic() + expiry - time.time())
+                return access_token
 
-    client_id = get_env_value("SP_API_CLIENT_ID")
-    client_secret = get_env_value("SP_API_SECRET")
-    refresh_token = get_env_value("SP_API_TOKEN")
+            access_token, expires_in = _request_access_token(
+                client_id, client_secret, refresh_token
+            )
+            _TOKEN_CACHE[cache_key] = (access_token, time.monotonic() + expires_in)
+            _write_token_file(cache_key, access_token, time.time() + expires_in)
+            return access_token
+
+
+def get_token_cache_path() -> Optional[Path]:
+    """Return the on-disk access token cache path, or None if no cache directory exists."""
+
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    if not cache_home:
+        try:
+            cache_home = Path.home() / ".cache"
+        except RuntimeError:  # pragma: no cover - no HOME and no passwd entry
+            return None
+    return Path(cache_home) / TOKEN_CACHE_FILENAME
+
+
+@contextmanager
+def _token_file_lock() -> Iterator[None]:
+    """Hold an exclusive lock shared by every process using the token cache."""
+
+    if fcntl is None:  # pragma: no cover - Windows has no fcntl
+        yield
+        return
+
+    cache_path = get_token_cache_path()
+    if cache_path is None:  # pragma: no cover - the cache is best effort
+        yield
+        return
+
+    lock_path = cache_path.with_suffix(".lock")
+    try:
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(lock_path, os.O_WRONLY | os.O_CREAT, 0o600)
+    except OSError:  # pragma: no cover - the cache is best effort
+        yield
+        return
+
+    try:
+        _try_flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+
+def _try_flock(fd: Any, operation: int) -> None:
+    """Lock ``fd`` if the filesystem allows it; the cache also works unlocked."""
+
+    if fcntl is None:  # pragma: no cover - Windows has no fcntl
+        return
+    try:
+        fcntl.flock(fd, operation)
+    except OSError:  # pragma: no cover - e.g. ENOLCK on NFS-mounted home directories
+        pass
+
+
+def _credentials_digest(cache_key: Tuple[str, str]) -> str:
+    """Identify a credential pair in the token file without storing the refresh token."""
+
+    return hashlib.sha256("\0".join(cache_key).encode("utf-8")).hexdigest()
+
+
+def _read_token_file(cache_key: Tuple[str, str]) -> Optional[Tuple[str, float]]:
+    """Return the stored token and its wall-clock expiry if it is still fresh."""
+
+    path = get_token_cache_path()
+    if path is None:
+        return None
+
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            if fcntl is not None:
+                _try_flock(handle, fcntl.LOCK_SH)
+            data = json.load(handle)
+        access_token = data["access_token"]
+        expiry = float(data["expiry"])
+        credentials = data["credentials"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    if credentials != _credentials_digest(cache_key) or time.time() >= expiry - TOKEN_EXPIRY_MARGIN:
+        return None
+    return access_token, expiry
+
+
+def _write_token_file(cache_key: Tuple[str, str], access_token: str, expiry: float) -> None:
+    """Persist the token so later CLI invocations can skip the OAuth request."""
+
+    path = get_token_cache_path()
+    if path is None:
+        return
+
+    data = {
+        "access_token": access_token,
+        "expiry": expiry,
+        "credentials": _credentials_digest(cache_key),
+    }
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            if fcntl is not None:
+                _try_flock(handle, fcntl.LOCK_EX)
+            # Truncate only once the lock is held so readers never see a partial file.
+            handle.truncate()
+            json.dump(data, handle)
+    except OSError:  # pragma: no cover - the cache is best effort
+        pass
+
+
+def _request_access_token(
+    client_id: str, client_secret: str, refresh_token: str
+) -> Tuple[str, float]:
+    """Request a new access token and return it with its lifetime in seconds."""
+
+    import requests
 
     payload = build_request_payload(client_id, client_secret, refresh_token)
 
     headers = {"Content-Type": FORM_CONTENT_TYPE}
 
     try:
-        response = requests.post(TOKEN_ENDPOINT, data=payload, headers=headers, timeout=30)
+        response = get_session().post(TOKEN_ENDPOINT, data=payload, headers=headers, timeout=30)
         response.raise_for_status()
     except requests.RequestException as exc:  # pragma: no cover - network failures
         raise RuntimeError(f"Failed to fetch access token: {exc}") from exc
 
-    response_text = response.text
-
     try:
-        response_json = response.json()
+        response_json = json_loads(response.content)
     except (json.JSONDecodeError, ValueError) as exc:  # pragma: no cover - defensive branch
         raise RuntimeError(
-            f"Amazon SP-API token endpoint returned non-JSON response: {response_text}"
+            f"Amazon SP-API token endpoint returned non-JSON response: {response.content[:512]!r}"
         ) from exc
 
     try:
@@ -87,8 +336,9 @@ def fetch_access_token() -> str:
             "Response JSON is missing the 'access_token' field."
         ) from exc
 
-    print(json.dumps(response_json, indent=2), file=sys.stderr)
-    return access_token
+    if os.environ.get("SP_API_DEBUG"):
+        print(json_dumps(response_json), file=sys.stderr)
+    return access_token, float(response_json.get("expires_in", 3600))
 
 
 if __name__ == "__main__":
@@ -1,9 +1,16 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import json
 import sys
-import requests
+import threading
+import time
 
-from fetch_sp_api_token import MissingEnvironmentVariableError, fetch_access_token
+from fetch_sp_api_token import (
+    MissingEnvironmentVariableError,
+    fetch_access_token,
+    get_session,
+    json_dumps,
+    json_loads,
+)
 
 sandbox_endpoints = {
     "NA": "sandbox.sellingpartnerapi-na.amazon.com",
@@ -11,24 +18,105 @@ sandbox_endpoints = {
     "FE": "sandbox.sellingpartnerapi-fe.amazon.com",
 }
 
-def fetch_example(sandbox_endpoints, token):
-    endpoint = sandbox_endpoints["NA"]
-    url = f"https://{endpoint}/orders/v0/orders"
+# The static sandbox only returns its TEST_CASE_200 getOrders mock for this marketplace
+sandbox_marketplace_ids = ["ATVPDKIKX0DER"]
+
+_ORDERS_URLS = {
+    region: f"https://{endpoint}/orders/v0/orders" for region, endpoint in sandbox_endpoints.items()
+}
+
+_BASE_HEADERS = {
+    "Content-Type": "application/json",
+    "User-Agent": "My-Testing-App/1.0"
+}
+
+# getOrders rate limit per region: 0.0167 requests/second with a burst of 20
+ORDERS_RATE = 0.0167
+ORDERS_BURST = 20
+
+class TokenBucket:
+    # Client-side rate limiter: allows bursts of `capacity` calls, refilled at `rate` per second
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        if now > self._updated:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            # A negative balance is demand queued ahead of us; wait for it to refill
+            wait = max(self._updated - now, 0.0) + max(-self._tokens, 0.0) / self.rate
+        if wait > 0:
+            time.sleep(wait)
+
+    def drain(self, delay=0.0):
+        # Called on a 429: empty the bucket and hold off refilling for `delay` seconds
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = max(self._updated, now + delay)
+
+_ORDERS_BUCKETS = {region: TokenBucket(ORDERS_RATE, ORDERS_BURST) for region in sandbox_endpoints}
+
+def _retry_after_seconds(response):
+    try:
+        return max(float(response.headers.get("Retry-After", 0)), 0.0)
+    except ValueError:
+        return 0.0
+
+def _get_orders(endpoint_key, token, marketplace_ids):
+    # getOrders accepts a comma-separated MarketplaceIds list, so every marketplace in one
+    # region is fetched in a single call. Cross-region calls still need one request per
+    # regional endpoint.
+    headers = {**_BASE_HEADERS, "x-amz-access-token": token}
     params = {
-        "MarketplaceIds": "ATVPDKIKX0DER",
+        "MarketplaceIds": ",".join(marketplace_ids),
         "CreatedAfter": "TEST_CASE_200"
     }
 
-    headers = {
-        "x-amz-access-token": token,
-        "Content-Type": "application/json",
-        "User-Agent": "My-Testing-App/1.0"
-    }
+    url = _ORDERS_URLS[endpoint_key]
 
-    response = requests.get(url, headers=headers, params=params)
+    bucket = _ORDERS_BUCKETS[endpoint_key]
+    bucket.acquire()
+    response = get_session().get(url, headers=headers, params=params, timeout=30)
+    if response.status_code == 429:
+        bucket.drain(_retry_after_seconds(response))
+    return response
+
+def fetch_example(endpoint_key, token, marketplace_ids):
+    response = _get_orders(endpoint_key, token, marketplace_ids)
 
     print(response.status_code)
-    return response.json()  # or response.text if not JSON
+    return json_loads(response.content)  # or response.text if not JSON
+
+def fetch_all_regions(marketplace_ids_by_region, token):
+    if not marketplace_ids_by_region:
+        return {}
+
+    def fetch_region(region, marketplace_ids):
+        response = _get_orders(region, token, marketplace_ids)
+        # Threads finish in any order, so label each status code with its region
+        print(region, response.status_code)
+        return json_loads(response.content)
+
+    # Regions are independent, so overlap their round trips on the shared session pool
+    with ThreadPoolExecutor(max_workers=len(marketplace_ids_by_region)) as executor:
+        futures = {
+            region: executor.submit(fetch_region, region, marketplace_ids)
+            for region, marketplace_ids in marketplace_ids_by_region.items()
+        }
+        return {region: future.result() for region, future in futures.items()}
 
 if __name__ == "__main__":
     try:
@@ -40,6 +128,6 @@ if __name__ == "__main__":
         print(f"Failed to retrieve access token: {error}", file=sys.stderr)
         sys.exit(1)
 
-    response = fetch_example(sandbox_endpoints, token)
-    print(json.dumps(response, indent=2))
+    response = fetch_example("NA", token, sandbox_marketplace_ids)
+    print(json_dumps(response))
 